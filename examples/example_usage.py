@@ -3,14 +3,17 @@
 Example usage of the 2D to 3D converter modules
 This script demonstrates how to use the API programmatically
 """
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sam_integration.sam_processor import SAMProcessor
-from mesh_processing.mesh_converter import MeshConverter
+from sam_integration.sam_processor import get_sam_processor
+from mesh_processing.mesh_converter import get_mesh_converter
 from PIL import Image
 import numpy as np
 
@@ -24,8 +27,8 @@ def example_1_basic_conversion():
     print("=" * 60)
 
     # Initialize processors
-    sam_processor = SAMProcessor()
-    mesh_converter = MeshConverter()
+    sam_processor = get_sam_processor()
+    mesh_converter = get_mesh_converter()
 
     # Load your image
     image_path = "path/to/your/image.jpg"
@@ -75,8 +78,8 @@ def example_2_with_existing_mask():
     print("=" * 60)
 
     # Initialize processors
-    sam_processor = SAMProcessor()
-    mesh_converter = MeshConverter()
+    sam_processor = get_sam_processor()
+    mesh_converter = get_mesh_converter()
 
     # Load image and mask
     image = sam_processor.load_image("path/to/image.jpg")
@@ -101,16 +104,71 @@ def example_2_with_existing_mask():
     return ply_path, mesh_path
 
 
-def example_3_batch_processing():
+# Per-worker converter for example 3, compiled once in _init_worker
+_convert = None
+
+
+def _init_worker():
+    """
+    Set up a batch worker process
+
+    Each worker converts one cloud at a time, so its KD-tree queries and
+    Numba kernels run single-threaded instead of every worker starting
+    one thread per core. The converter is compiled once here and reused
+    for every cloud the worker handles.
+    """
+    global _convert
+
+    try:
+        import numba
+        numba.set_num_threads(1)
+    except ImportError:
+        pass
+
+    mesh_converter = get_mesh_converter()
+    mesh_converter.num_workers = 1
+    _convert = mesh_converter.compile(
+        depth=9, density_threshold=0.01, resolution=20000
+    )
+
+
+def _convert_one(item):
+    """
+    Convert one point cloud to a watertight mesh for example 3
+
+    Args:
+        item: (index, ply_path) tuple
+
+    Returns:
+        Path to the mesh, or None on failure
+    """
+    i, ply_path = item
+
+    try:
+        return _convert(ply_path, output_dir=f"output/batch_{i}")
+
+    except Exception as e:
+        print(f"✗ Failed: {ply_path} - {e}")
+        return None
+
+
+def example_3_batch_processing(max_workers=None):
     """
     Example 3: Batch process multiple images
+
+    SAM 3D inference runs serially in this process, since every process
+    would load its own copy of the model onto the GPU. The CPU-bound mesh
+    conversions are then spread over a process pool.
+
+    Args:
+        max_workers: Number of worker processes
+                     (default: one per cloud, up to the CPU count)
     """
     print("\n" + "=" * 60)
     print("Example 3: Batch Processing Multiple Images")
     print("=" * 60)
 
-    sam_processor = SAMProcessor()
-    mesh_converter = MeshConverter()
+    sam_processor = get_sam_processor()
 
     # List of images to process
     images_and_masks = [
@@ -119,33 +177,40 @@ def example_3_batch_processing():
         ("image3.jpg", "mask3.png"),
     ]
 
-    results = []
-
+    # Step 1: Generate point clouds on the GPU, one image at a time
+    jobs = []
     for i, (img_path, mask_path) in enumerate(images_and_masks, 1):
-        print(f"\nProcessing image {i}/{len(images_and_masks)}...")
+        print(f"\nGenerating point cloud {i}/{len(images_and_masks)}...")
 
         try:
-            # Load
             image = sam_processor.load_image(img_path)
             mask = sam_processor.load_mask(mask_path)
 
-            # Generate point cloud
             ply_path = sam_processor.generate_point_cloud(
                 image, mask, output_dir=f"output/batch_{i}", seed=i
             )
-
-            # Convert to mesh
-            mesh_path = mesh_converter.convert_to_watertight_mesh(
-                ply_path, output_dir=f"output/batch_{i}"
-            )
-
-            results.append((img_path, ply_path, mesh_path))
-            print(f"✓ Completed: {img_path}")
+            jobs.append((i, img_path, ply_path))
 
         except Exception as e:
             print(f"✗ Failed: {img_path} - {e}")
             continue
 
+    # Step 2: Convert the point clouds to meshes in parallel. Workers are
+    # spawned rather than forked, as this process holds a CUDA context.
+    results = []
+    if jobs:
+        max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        ) as ex:
+            mesh_paths = ex.map(_convert_one, [(i, ply) for i, _, ply in jobs])
+            for (_, img_path, ply_path), mesh_path in zip(jobs, mesh_paths):
+                if mesh_path is not None:
+                    results.append((img_path, ply_path, mesh_path))
+                    print(f"✓ Completed: {img_path}")
+
     print(f"\nBatch processing complete: {len(results)}/{len(images_and_masks)} successful")
     return results
 
@@ -158,7 +223,7 @@ def example_4_advanced_mesh_processing():
     print("Example 4: Advanced Mesh Processing")
     print("=" * 60)
 
-    mesh_converter = MeshConverter()
+    mesh_converter = get_mesh_converter()
 
     # Load existing point cloud
     ply_path = "path/to/pointcloud.ply"
@@ -211,7 +276,7 @@ def example_5_visualize_results():
     print("Example 5: Visualize Mesh")
     print("=" * 60)
 
-    mesh_converter = MeshConverter()
+    mesh_converter = get_mesh_converter()
 
     mesh_path = "path/to/mesh.obj"
 
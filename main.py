@@ -61,8 +61,8 @@ Examples:
     parser.add_argument(
         "--depth",
         type=int,
-        default=9,
-        help="Poisson reconstruction depth (default: 9)"
+        default=None,
+        help="Poisson reconstruction depth (default: auto from point count)"
     )
 
     parser.add_argument(
@@ -83,21 +83,21 @@ Examples:
 
     elif args.visualize:
         # Visualize mesh
-        from mesh_processing.mesh_converter import MeshConverter
-        converter = MeshConverter()
+        from mesh_processing.mesh_converter import get_mesh_converter
+        converter = get_mesh_converter()
         converter.visualize_mesh(args.visualize)
 
     elif args.image and args.mask:
         # CLI mode
-        from sam_integration.sam_processor import SAMProcessor
-        from mesh_processing.mesh_converter import MeshConverter
+        from sam_integration.sam_processor import get_sam_processor
+        from mesh_processing.mesh_converter import get_mesh_converter
         from PIL import Image
 
         print("Running 2D to 3D conversion...")
 
         # Initialize processors
-        sam_processor = SAMProcessor()
-        mesh_converter = MeshConverter()
+        sam_processor = get_sam_processor()
+        mesh_converter = get_mesh_converter()
 
         # Load image and mask
         image = Image.open(args.image)
@@ -7,21 +7,29 @@ from PIL import Image
 import os
 import sys
 from pathlib import Path
-import cv2
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sam_integration.sam_processor import SAMProcessor
-from mesh_processing.mesh_converter import MeshConverter
-
 
 class App:
+    # Filled disk used to mark selected points
+    MARKER_RADIUS = 5
+    MARKER_COLOR = (255, 0, 0)
+    _yy, _xx = np.ogrid[-MARKER_RADIUS:MARKER_RADIUS + 1, -MARKER_RADIUS:MARKER_RADIUS + 1]
+    MARKER_DISK = (_xx * _xx + _yy * _yy) <= MARKER_RADIUS * MARKER_RADIUS
+    del _yy, _xx
+
     def __init__(self):
-        self.sam_processor = SAMProcessor()
-        self.mesh_converter = MeshConverter()
+        # Imported here so loading the GUI module does not pull in torch/open3d
+        from sam_integration.sam_processor import get_sam_processor
+        from mesh_processing.mesh_converter import get_mesh_converter
+
+        self.sam_processor = get_sam_processor()
+        self.mesh_converter = get_mesh_converter()
         self.current_image = None
         self.selected_points = []
+        self._img_array = None  # Annotated copy of current_image
 
     def process_image_click(self, image, evt: gr.SelectData):
         """Handle image click events to collect coordinates"""
@@ -35,19 +43,47 @@ class App:
         x, y = evt.index[0], evt.index[1]
         self.selected_points.append((x, y))
 
-        # Draw points on image
-        img_array = np.array(image)
-        for point in self.selected_points:
-            px, py = point
-            # Draw a circle at the clicked point
-            cv2.circle(img_array, (px, py), 5, (255, 0, 0), -1)
+        # Rebuild the annotated array only when the image changed,
+        # otherwise just draw the new point on the cached one
+        if self._img_array is None or self._img_array.shape[1::-1] != image.size:
+            self._redraw_all_points(image)
+        else:
+            self._stamp_point(x, y)
 
         status = f"Selected {len(self.selected_points)} point(s). Last point: ({x}, {y})"
-        return Image.fromarray(img_array), status
+        return Image.fromarray(self._img_array.copy()), status
+
+    def _stamp_point(self, px, py):
+        """Draw a marker disk at (px, py) on the cached image array"""
+        r = self.MARKER_RADIUS
+        h, w = self._img_array.shape[:2]
+        y0, y1 = max(py - r, 0), min(py + r + 1, h)
+        x0, x1 = max(px - r, 0), min(px + r + 1, w)
+        if y0 >= y1 or x0 >= x1:
+            return
+
+        region = self._img_array[y0:y1, x0:x1]
+        disk = self.MARKER_DISK[y0 - py + r:y1 - py + r, x0 - px + r:x1 - px + r]
+        if region.ndim == 2:
+            region[disk] = self.MARKER_COLOR[0]
+        else:
+            channels = min(region.shape[2], len(self.MARKER_COLOR))
+            region[disk, :channels] = self.MARKER_COLOR[:channels]
+
+    def _redraw_all_points(self, image):
+        """Rebuild the cached image array with all selected points drawn"""
+        self._img_array = np.array(image)
+        for px, py in self.selected_points:
+            self._stamp_point(px, py)
+
+    def _reset_image_cache(self):
+        """Drop the annotated image cache when a new image is loaded"""
+        self._img_array = None
 
     def clear_points(self):
         """Clear all selected points"""
         self.selected_points = []
+        self._img_array = None
         if self.current_image is not None:
             return self.current_image, "Points cleared"
         return None, "Points cleared"
@@ -132,6 +168,8 @@ class App:
                 mesh_output = gr.File(label="Watertight Mesh")
 
             # Event handlers
+            input_image.change(self._reset_image_cache)
+
             input_image.select(
                 self.process_image_click,
                 inputs=[input_image],
@@ -1,21 +1,400 @@
 """
 Mesh processing utilities for converting point clouds to watertight meshes
 """
+from __future__ import annotations
+
+import math
 import numpy as np
-import open3d as o3d
-import trimesh
 import os
+from functools import lru_cache, partial
+from importlib import import_module
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+# Heavy and optional dependencies are imported where used to keep import
+# time low; see _numba_normals(), _mcubes() and _vdb() for the optional ones
+if TYPE_CHECKING:
+    import open3d as o3d
+    import trimesh
+    from scipy.spatial import cKDTree
+
+# Largest surface (in voxel faces, area / pitch^2) meshed by the OpenVDB
+# path. The narrow band holds about six voxels per surface voxel and the
+# extracted mesh about two triangles, so this keeps the step near 2 GB.
+MAX_VDB_SURFACE_VOXELS = 4_000_000
+
+# Largest voxel grid (in cells) built for the watertight fallback.
+# Voxelizing, filling and marching cubes peak at roughly 60 bytes per
+# cell, so this keeps the step around 2 GB.
+MAX_DENSE_VOXELS = 32_000_000
+
+# Clouds larger than this use the Numba normal kernel when available
+NUMBA_MIN_POINTS = 50_000
+
+# Points per tile in normal estimation (bounds the KNN temporaries)
+NORMAL_TILE_SIZE = 8192
+
+# PLY scalar property types mapped to little-endian NumPy dtypes
+_PLY_DTYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+# Binary STL face record: normal, three vertices, attribute byte count
+_STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("v0", "<f4", (3,)),
+    ("v1", "<f4", (3,)),
+    ("v2", "<f4", (3,)),
+    ("attr", "<u2"),
+])
+
+
+def _fast_read_ply_xyz(path: str) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    Read vertex positions (and normals) from a binary PLY via np.memmap
+
+    Only handles binary little-endian files whose first element is
+    "vertex" with scalar properties starting with float x, y, z.
+
+    Args:
+        path: Path to .ply file
+
+    Returns:
+        Tuple of (points, normals or None), or None if the file
+        layout is not supported by the fast path
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.readline().strip() != b"ply":
+                return None
+
+            fmt = None
+            vertex_count = None
+            fields = []
+            element = None
+            while True:
+                line = f.readline()
+                if not line:
+                    return None
+                tokens = line.decode("ascii").split()
+                if not tokens or tokens[0] in ("comment", "obj_info"):
+                    continue
+                if tokens[0] == "end_header":
+                    break
+                if tokens[0] == "format":
+                    fmt = tokens[1:]
+                elif tokens[0] == "element":
+                    element = tokens[1]
+                    if vertex_count is None:
+                        if element != "vertex":
+                            return None
+                        vertex_count = int(tokens[2])
+                elif tokens[0] == "property" and element == "vertex":
+                    if tokens[1] == "list" or tokens[1] not in _PLY_DTYPES:
+                        return None
+                    fields.append((tokens[2], "<" + _PLY_DTYPES[tokens[1]]))
+            header_end = f.tell()
+    except (OSError, UnicodeDecodeError, IndexError, ValueError):
+        return None
+
+    if fmt != ["binary_little_endian", "1.0"] or vertex_count is None:
+        return None
+    if [name for name, _ in fields[:3]] != ["x", "y", "z"] or \
+            any(dtype != "<f4" for _, dtype in fields[:3]):
+        return None
+
+    try:
+        vertices = np.memmap(path, dtype=np.dtype(fields), mode="r",
+                             offset=header_end, shape=(vertex_count,))
+    except ValueError:
+        return None
+
+    # Open3D expects float64, so copy each column straight into that layout
+    points = np.empty((vertex_count, 3), dtype=np.float64)
+    for axis, name in enumerate(("x", "y", "z")):
+        points[:, axis] = vertices[name]
+
+    normals = None
+    if all(name in vertices.dtype.names for name in ("nx", "ny", "nz")):
+        normals = np.empty((vertex_count, 3), dtype=np.float64)
+        for axis, name in enumerate(("nx", "ny", "nz")):
+            normals[:, axis] = vertices[name]
+
+    return points, normals
+
+
+def _normals_numpy(points: np.ndarray, idx: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    Compute PCA normals for all points at once
+
+    Args:
+        points: (N, 3) point coordinates
+        idx: (N, k) neighbor indices
+        valid: (N, k) mask of neighbors to include
+
+    Returns:
+        (N, 3) unit normals (eigenvector of the smallest eigenvalue)
+    """
+    weights = valid[..., None].astype(points.dtype)
+    neighbors = points[idx] * weights
+    counts = weights.sum(axis=1, keepdims=True)
+    centered = (neighbors - neighbors.sum(axis=1, keepdims=True) / counts) * weights
+    cov = np.einsum('nki,nkj->nij', centered, centered)
+    _, eigvecs = np.linalg.eigh(cov)
+    return eigvecs[:, :, 0]
+
+
+@lru_cache(maxsize=1)
+def _mcubes():
+    """Return the PyMCubes module, or None if it is not installed"""
+    try:
+        import mcubes
+        return mcubes
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _vdb():
+    """Return the OpenVDB Python bindings, or None if they are not installed"""
+    for name in ("pyopenvdb", "openvdb"):
+        try:
+            return import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=1)
+def _numba_normals():
+    """
+    Build the Numba normal kernel on first use
+
+    Returns:
+        Jitted _normals_numba(points, idx, valid), or None if numba
+        is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(inline='always', fastmath=True)
+    def _smallest_eigvec3(a00, a01, a02, a11, a12, a22):
+        """Closed-form eigenvector of the smallest eigenvalue of a symmetric 3x3 matrix"""
+        p1 = a01 * a01 + a02 * a02 + a12 * a12
+        q = (a00 + a11 + a22) / 3.0
+        d0 = a00 - q
+        d1 = a11 - q
+        d2 = a22 - q
+        p = math.sqrt((d0 * d0 + d1 * d1 + d2 * d2 + 2.0 * p1) / 6.0)
+
+        if p1 == 0.0 or p == 0.0:
+            # Diagonal (or isotropic) matrix: pick the smallest axis
+            if a00 <= a11 and a00 <= a22:
+                return 1.0, 0.0, 0.0
+            if a11 <= a22:
+                return 0.0, 1.0, 0.0
+            return 0.0, 0.0, 1.0
+
+        # Roots of the characteristic cubic via the trigonometric form
+        b00 = d0 / p
+        b11 = d1 / p
+        b22 = d2 / p
+        b01 = a01 / p
+        b02 = a02 / p
+        b12 = a12 / p
+        r = 0.5 * (b00 * (b11 * b22 - b12 * b12)
+                   - b01 * (b01 * b22 - b12 * b02)
+                   + b02 * (b01 * b12 - b11 * b02))
+        r = min(1.0, max(-1.0, r))
+        phi = math.acos(r) / 3.0
+        lam = q + 2.0 * p * math.cos(phi + 2.0 * math.pi / 3.0)
+
+        # Eigenvector is orthogonal to the rows of (A - lam * I)
+        m00 = a00 - lam
+        m11 = a11 - lam
+        m22 = a22 - lam
+        c0x = a01 * a12 - a02 * m11
+        c0y = a02 * a01 - m00 * a12
+        c0z = m00 * m11 - a01 * a01
+        c1x = a01 * m22 - a02 * a12
+        c1y = a02 * a02 - m00 * m22
+        c1z = m00 * a12 - a01 * a02
+        c2x = m11 * m22 - a12 * a12
+        c2y = a12 * a02 - a01 * m22
+        c2z = a01 * a12 - m11 * a02
+        n0 = c0x * c0x + c0y * c0y + c0z * c0z
+        n1 = c1x * c1x + c1y * c1y + c1z * c1z
+        n2 = c2x * c2x + c2y * c2y + c2z * c2z
+
+        if n0 >= n1 and n0 >= n2 and n0 > 0.0:
+            s = 1.0 / math.sqrt(n0)
+            return c0x * s, c0y * s, c0z * s
+        if n1 >= n2 and n1 > 0.0:
+            s = 1.0 / math.sqrt(n1)
+            return c1x * s, c1y * s, c1z * s
+        if n2 > 0.0:
+            s = 1.0 / math.sqrt(n2)
+            return c2x * s, c2y * s, c2z * s
+        return 0.0, 0.0, 1.0
+
+    @njit(parallel=True, fastmath=True)
+    def _normals_numba(points, idx, valid):
+        """
+        Compute PCA normals with a fused gather/covariance/eigen kernel
+
+        Args:
+            points: (N, 3) point coordinates
+            idx: (N, k) neighbor indices
+            valid: (N, k) mask of neighbors to include
+
+        Returns:
+            (N, 3) unit normals
+        """
+        n, k = idx.shape
+        normals = np.empty((n, 3), dtype=np.float64)
+
+        for i in prange(n):
+            cx = 0.0
+            cy = 0.0
+            cz = 0.0
+            count = 0
+            for j in range(k):
+                if valid[i, j]:
+                    nb = idx[i, j]
+                    cx += points[nb, 0]
+                    cy += points[nb, 1]
+                    cz += points[nb, 2]
+                    count += 1
+            cx /= count
+            cy /= count
+            cz /= count
+
+            a00 = 0.0
+            a01 = 0.0
+            a02 = 0.0
+            a11 = 0.0
+            a12 = 0.0
+            a22 = 0.0
+            for j in range(k):
+                if valid[i, j]:
+                    nb = idx[i, j]
+                    dx = points[nb, 0] - cx
+                    dy = points[nb, 1] - cy
+                    dz = points[nb, 2] - cz
+                    a00 += dx * dx
+                    a01 += dx * dy
+                    a02 += dx * dz
+                    a11 += dy * dy
+                    a12 += dy * dz
+                    a22 += dz * dz
+
+            nx, ny, nz = _smallest_eigvec3(a00, a01, a02, a11, a12, a22)
+            normals[i, 0] = nx
+            normals[i, 1] = ny
+            normals[i, 2] = nz
+
+        return normals
+
+    return _normals_numba
+
+
+def _average_spacing(
+    points: np.ndarray,
+    workers: int = -1,
+    tree: Optional[cKDTree] = None
+) -> float:
+    """
+    Mean nearest-neighbor distance of a point cloud
+
+    Args:
+        points: (N, 3) point coordinates
+        workers: Threads for the KD-tree query (-1 = all cores)
+        tree: KD-tree over points (built if not given)
+
+    Returns:
+        Average spacing (0.0 for fewer than two points)
+    """
+    from scipy.spatial import cKDTree
+
+    if len(points) < 2:
+        return 0.0
+    if tree is None:
+        tree = cKDTree(points)
+    # Column 0 is the point itself, column 1 its nearest neighbor
+    dist, _ = tree.query(points, k=2, workers=workers)
+    return float(np.mean(dist[:, 1]))
+
+
+def _estimate_normals_tiled(
+    points: np.ndarray,
+    k: int = 30,
+    avg_dist: Optional[float] = None,
+    workers: int = -1,
+    tree: Optional[cKDTree] = None
+) -> np.ndarray:
+    """
+    Compute PCA normals tile by tile from one shared KD-tree
+
+    Neighbor indices and distances are only materialized per tile, so the
+    (N, k) temporaries never exist for the whole cloud at once.
+
+    Args:
+        points: (N, 3) point coordinates
+        k: Maximum neighbors per point
+        avg_dist: Precomputed average spacing (computed if not given)
+        workers: Threads for the KD-tree queries (-1 = all cores)
+        tree: KD-tree over points (built if not given)
+
+    Returns:
+        (N, 3) unit normals
+    """
+    from scipy.spatial import cKDTree
+
+    if tree is None:
+        tree = cKDTree(points)
+
+    if avg_dist is None:
+        # Column 0 is the point itself, column 1 its nearest neighbor
+        avg_dist = np.mean(tree.query(points, k=2, workers=workers)[0][:, 1])
+    radius = avg_dist * 2
+
+    kernel = _numba_normals() if len(points) > NUMBA_MIN_POINTS else None
+    if kernel is None:
+        kernel = _normals_numpy
+
+    normals = np.empty((len(points), 3), dtype=np.float64)
+    for start in range(0, len(points), NORMAL_TILE_SIZE):
+        stop = min(start + NORMAL_TILE_SIZE, len(points))
+        dist, idx = tree.query(points[start:stop], k=k, workers=workers)
+
+        # Neighbors beyond the radius are masked out
+        valid = dist <= radius
+        idx[~valid] = 0
+        normals[start:stop] = kernel(points, idx, valid)
+
+    return normals
 
 
 class MeshConverter:
     """Converts point clouds to watertight meshes"""
 
-    def __init__(self):
-        """Initialize mesh converter"""
+    def __init__(self, num_workers: int = -1):
+        """
+        Initialize mesh converter
+
+        Args:
+            num_workers: Threads for KD-tree queries (-1 = all cores)
+        """
+        self.num_workers = num_workers
         self.default_depth = 9  # Poisson reconstruction depth
         self.default_scale = 1.1  # Scale factor for reconstruction
+        self.min_depth = 6  # Lower bound for adaptive depth selection
+        self.max_depth = 11  # Upper bound for adaptive depth selection
 
     def load_point_cloud(self, ply_path: str) -> o3d.geometry.PointCloud:
         """
@@ -27,39 +406,177 @@ class MeshConverter:
         Returns:
             Open3D PointCloud object
         """
-        pcd = o3d.io.read_point_cloud(ply_path)
+        import open3d as o3d
+
+        data = _fast_read_ply_xyz(ply_path)
+        if data is not None:
+            points, normals = data
+            pcd = o3d.geometry.PointCloud()
+            pcd.points = o3d.utility.Vector3dVector(points)
+            if normals is not None:
+                pcd.normals = o3d.utility.Vector3dVector(normals)
+        else:
+            pcd = o3d.io.read_point_cloud(ply_path)
         print(f"Loaded point cloud with {len(pcd.points)} points")
         return pcd
 
-    def estimate_normals(self, pcd: o3d.geometry.PointCloud) -> o3d.geometry.PointCloud:
+    def estimate_normals(
+        self,
+        pcd: o3d.geometry.PointCloud,
+        camera_location: Optional[np.ndarray] = None,
+        avg_spacing: Optional[float] = None,
+        tree: Optional[cKDTree] = None
+    ) -> o3d.geometry.PointCloud:
         """
         Estimate normals for point cloud
 
         Args:
             pcd: Input point cloud
+            camera_location: Camera origin the cloud was captured from. If
+                             given, normals are flipped to face it (cheap);
+                             otherwise a consistent tangent-plane orientation
+                             is computed (slow on large clouds)
+            avg_spacing: Precomputed average nearest-neighbor distance of
+                         pcd (computed if not given)
+            tree: KD-tree over the points of pcd, reused by the CPU path
+                  (built if not given)
 
         Returns:
             Point cloud with estimated normals
         """
+        import open3d as o3d
+
         print("Estimating normals...")
 
-        # Estimate radius for normal computation
-        distances = pcd.compute_nearest_neighbor_distance()
-        avg_dist = np.mean(distances)
-        radius = avg_dist * 2
+        normals = None
+        if o3d.core.cuda.is_available():
+            try:
+                normals = self._estimate_normals_tensor(
+                    pcd, o3d.core.Device("CUDA:0"), avg_spacing
+                )
+            except RuntimeError as e:
+                print(f"Tensor normal estimation failed ({e}), using CPU path")
 
-        pcd.estimate_normals(
-            search_param=o3d.geometry.KDTreeSearchParamHybrid(
-                radius=radius,
-                max_nn=30
+        if normals is None:
+            normals = _estimate_normals_tiled(
+                np.asarray(pcd.points),
+                avg_dist=avg_spacing,
+                workers=self.num_workers,
+                tree=tree
             )
-        )
+        pcd.normals = o3d.utility.Vector3dVector(normals)
 
         # Orient normals consistently
-        pcd.orient_normals_consistent_tangent_plane(k=15)
+        if camera_location is not None:
+            pcd.orient_normals_towards_camera_location(
+                camera_location=np.asarray(camera_location, dtype=np.float64)
+            )
+        else:
+            # The MST is built over a k-NN graph, so its cost grows with k.
+            # k=10 (Open3D's default) can mis-orient thin or tightly curved
+            # regions slightly more often than k=15.
+            pcd.orient_normals_consistent_tangent_plane(k=10)
 
         return pcd
 
+    def _estimate_normals_tensor(
+        self,
+        pcd: o3d.geometry.PointCloud,
+        device: o3d.core.Device,
+        avg_spacing: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Estimate normals with Open3D's tensor API on the given device
+
+        Uses the same radius (twice the average nearest-neighbor distance)
+        and neighbor cap as the CPU path.
+
+        Args:
+            pcd: Input point cloud
+            device: Open3D device to run on
+            avg_spacing: Precomputed average spacing (computed if not given)
+
+        Returns:
+            (N, 3) unit normals
+        """
+        import open3d as o3d
+
+        tpcd = o3d.t.geometry.PointCloud.from_legacy(pcd, device=device)
+        positions = tpcd.point.positions
+
+        if avg_spacing is None:
+            # knn_search returns squared distances; column 1 is the nearest neighbor
+            nns = o3d.core.nns.NearestNeighborSearch(positions)
+            nns.knn_index()
+            _, sq_dist = nns.knn_search(positions, 2)
+            avg_spacing = float(np.sqrt(sq_dist[:, 1].cpu().numpy()).mean())
+
+        tpcd.estimate_normals(max_nn=30, radius=avg_spacing * 2)
+        return tpcd.point.normals.cpu().numpy().astype(np.float64)
+
+    def select_poisson_depth(
+        self,
+        pcd: o3d.geometry.PointCloud,
+        avg_spacing: Optional[float] = None
+    ) -> int:
+        """
+        Pick a Poisson octree depth suited to the point cloud
+
+        The octree has up to 8^depth nodes, so the depth is chosen such
+        that 8^depth roughly matches the number of points. If the average
+        point spacing is known, the depth is further capped so the finest
+        octree cells are not smaller than the sampling resolution.
+
+        Args:
+            pcd: Input point cloud
+            avg_spacing: Average nearest-neighbor distance (optional)
+
+        Returns:
+            Octree depth for Poisson reconstruction
+        """
+        n_points = len(pcd.points)
+        if n_points < 2:
+            return self.default_depth
+
+        depth = int(round(math.log(n_points, 8)))
+
+        if avg_spacing is not None and avg_spacing > 0:
+            extent = pcd.get_axis_aligned_bounding_box().get_extent().max()
+            if extent > 0:
+                depth = min(depth, int(math.ceil(math.log2(extent / avg_spacing))))
+
+        return max(self.min_depth, min(self.max_depth, depth))
+
+    def downsample_for_poisson(
+        self,
+        pcd: o3d.geometry.PointCloud,
+        depth: int
+    ) -> o3d.geometry.PointCloud:
+        """
+        Voxel-downsample a dense point cloud to the Poisson octree resolution
+
+        Points beyond ~2 samples per finest octree cell add no detail to
+        the reconstruction, but still cost time in octree construction.
+
+        Args:
+            pcd: Input point cloud
+            depth: Poisson reconstruction depth
+
+        Returns:
+            Downsampled point cloud (or the input if already sparse enough)
+        """
+        cells = 2 ** depth
+        if len(pcd.points) <= cells * cells:
+            return pcd
+
+        extent = pcd.get_axis_aligned_bounding_box().get_extent().max()
+        # Spacing of cell / sqrt(2) leaves ~2 samples per cell on the surface
+        voxel_size = extent / cells / math.sqrt(2)
+        down = pcd.voxel_down_sample(voxel_size)
+        print(f"Downsampled point cloud to {len(down.points)} points "
+              f"(voxel size {voxel_size:.6f})")
+        return down
+
     def poisson_reconstruction(
         self,
         pcd: o3d.geometry.PointCloud,
@@ -82,6 +599,8 @@ class MeshConverter:
         Returns:
             Tuple of (reconstructed mesh, vertex densities)
         """
+        import open3d as o3d
+
         print(f"Running Poisson reconstruction (depth={depth})...")
 
         mesh, densities = o3d.geometry.TriangleMesh.create_from_point_cloud_poisson(
@@ -118,13 +637,18 @@ class MeshConverter:
 
         # Remove low-density vertices if densities are provided
         if densities is not None:
-            vertices_to_remove = densities < np.quantile(densities, density_threshold)
-            mesh.remove_vertices_by_mask(vertices_to_remove)
+            d = np.asarray(densities)
+            if d.size > 0:
+                # Single order statistic: O(N) partition instead of a quantile sort
+                k = min(int(density_threshold * d.size), d.size - 1)
+                threshold = np.partition(d, k)[k]
+                mesh.remove_vertices_by_mask(d < threshold)
 
-        # Remove degenerate triangles
+        # Merge duplicated vertices first so the triangle passes below
+        # operate on the smallest index space
+        mesh.remove_duplicated_vertices()
         mesh.remove_degenerate_triangles()
         mesh.remove_duplicated_triangles()
-        mesh.remove_duplicated_vertices()
         mesh.remove_non_manifold_edges()
 
         print(f"Cleaned mesh: {len(mesh.vertices)} vertices, "
@@ -135,7 +659,8 @@ class MeshConverter:
     def make_watertight(
         self,
         mesh: o3d.geometry.TriangleMesh,
-        resolution: int = 20000
+        resolution: int = 20000,
+        use_vdb: bool = False
     ) -> trimesh.Trimesh:
         """
         Convert mesh to watertight using voxelization
@@ -143,16 +668,24 @@ class MeshConverter:
         Args:
             mesh: Input mesh
             resolution: Voxel resolution for watertightness
+            use_vdb: Use the sparse OpenVDB level set (if installed)
+                     instead of the dense voxel grid
 
         Returns:
             Watertight trimesh
         """
+        import trimesh
+
         print("Making mesh watertight...")
 
-        # Convert Open3D mesh to trimesh
-        vertices = np.asarray(mesh.vertices)
-        triangles = np.asarray(mesh.triangles)
-        tri_mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
+        # Convert Open3D mesh to trimesh. Poisson output is already indexed
+        # and consistently wound, so skip trimesh's merge/validate pass.
+        tri_mesh = trimesh.Trimesh(
+            vertices=np.asarray(mesh.vertices),
+            faces=np.asarray(mesh.triangles),
+            process=False,
+            validate=False
+        )
 
         # Method 1: Try to fill holes
         if not tri_mesh.is_watertight:
@@ -163,15 +696,16 @@ class MeshConverter:
         if not tri_mesh.is_watertight:
             print("Using voxelization to ensure watertightness...")
 
-            # Create voxelized version
-            pitch = tri_mesh.bounding_box.extents.max() / resolution
-            voxelized = tri_mesh.voxelized(pitch=pitch)
-
-            # Convert back to mesh
-            tri_mesh = voxelized.as_boxes().to_mesh()
+            # Hole filling only adds faces, so the extents of the raw
+            # vertices are still valid and avoid building a bounding box
+            vertices = tri_mesh.vertices
+            extents = vertices.max(axis=0) - vertices.min(axis=0)
+            pitch = float(extents.max()) / resolution
 
-            # Smooth the voxelized mesh
-            tri_mesh = trimesh.smoothing.filter_laplacian(tri_mesh)
+            if use_vdb and _vdb() is not None:
+                tri_mesh = self._watertight_vdb(tri_mesh, pitch)
+            else:
+                tri_mesh = self._watertight_dense(tri_mesh, pitch)
 
         if tri_mesh.is_watertight:
             print("Mesh is now watertight!")
@@ -180,6 +714,113 @@ class MeshConverter:
 
         return tri_mesh
 
+    def _watertight_dense(self, tri_mesh: trimesh.Trimesh, pitch: float) -> trimesh.Trimesh:
+        """
+        Rebuild a closed surface from a dense voxel grid
+
+        Args:
+            tri_mesh: Input mesh
+            pitch: Voxel edge length
+
+        Returns:
+            Mesh extracted from the voxelized input
+        """
+        import trimesh
+
+        # Voxelizing itself scales with the grid size, so check the budget
+        # before building it and coarsen the pitch if it is exceeded
+        extents = np.ptp(tri_mesh.vertices, axis=0)
+        n_cells = int(np.prod(np.ceil(extents / pitch) + 1))
+        if n_cells > MAX_DENSE_VOXELS:
+            pitch *= (n_cells / MAX_DENSE_VOXELS) ** (1.0 / 3.0)
+            print(f"Voxel grid of {n_cells} cells exceeds the limit "
+                  f"({MAX_DENSE_VOXELS}), coarsening pitch to {pitch:.6f}")
+
+        voxelized = tri_mesh.voxelized(pitch=pitch)
+
+        mcubes = _mcubes()
+        if mcubes is not None:
+            # Extract the isosurface of the solid occupancy grid. The
+            # orthographic fill tolerates holes in the surface shell and
+            # the padding closes surfaces touching the grid border.
+            solid = voxelized.fill(method='orthographic')
+            grid = np.pad(solid.matrix.astype(np.float32), 1)
+            verts, faces = mcubes.marching_cubes(grid, 0.5)
+            verts = trimesh.transform_points(verts - 1.0, voxelized.transform)
+            result = trimesh.Trimesh(vertices=verts, faces=faces)
+            result.fix_normals()
+            return result
+
+        # Convert back to mesh
+        tri_mesh = voxelized.as_boxes()
+
+        # Smooth the voxelized mesh
+        return trimesh.smoothing.filter_laplacian(tri_mesh)
+
+    def _watertight_vdb(self, tri_mesh: trimesh.Trimesh, pitch: float) -> trimesh.Trimesh:
+        """
+        Rebuild a closed surface from a sparse OpenVDB level set
+
+        Only a narrow band around the surface is allocated, so fine pitches
+        do not need a dense grid. The input is still open here, so its
+        level set sign is unreliable; the surface is instead wrapped in an
+        unsigned distance shell one voxel thick, whose outer wall is closed
+        and is eroded back by one voxel.
+
+        Args:
+            tri_mesh: Input mesh
+            pitch: Voxel edge length
+
+        Returns:
+            Mesh extracted from the level set
+        """
+        import trimesh
+
+        # The narrow band scales with the surface, not the bounding box
+        n_surface = int(tri_mesh.area / pitch ** 2)
+        if n_surface > MAX_VDB_SURFACE_VOXELS:
+            pitch *= (n_surface / MAX_VDB_SURFACE_VOXELS) ** 0.5
+            print(f"Surface of {n_surface} voxels exceeds the limit "
+                  f"({MAX_VDB_SURFACE_VOXELS}), coarsening pitch to {pitch:.6f}")
+
+        vdb = _vdb()
+        transform = vdb.createLinearTransform(voxelSize=pitch)
+
+        def to_mesh(grid, isovalue):
+            points, triangles, quads = grid.convertToPolygons(isovalue=isovalue)
+            # Split quads into triangles
+            faces = np.vstack([
+                triangles.reshape(-1, 3),
+                quads[:, [0, 1, 2]],
+                quads[:, [0, 2, 3]]
+            ])
+            return trimesh.Trimesh(vertices=points, faces=faces, process=False)
+
+        # Unsigned distance: drop the (possibly leaked) inside/outside sign
+        grid = vdb.FloatGrid.createLevelSetFromPolygons(
+            tri_mesh.vertices.astype(np.float32),
+            triangles=tri_mesh.faces.astype(np.int32),
+            transform=transform,
+            halfWidth=3.0
+        )
+        grid.mapAll(abs)
+
+        # Dilate by one voxel. Holes narrower than two voxels are bridged,
+        # so the outer wall is its own component with the largest extents.
+        shell = to_mesh(grid, pitch).split(only_watertight=False)
+        outer = max(shell, key=lambda part: np.prod(part.extents))
+
+        # Erode by one voxel; the outer wall is closed, so its sign is valid
+        grid = vdb.FloatGrid.createLevelSetFromPolygons(
+            outer.vertices.astype(np.float32),
+            triangles=outer.faces.astype(np.int32),
+            transform=transform,
+            halfWidth=3.0
+        )
+        result = to_mesh(grid, -pitch)
+        result.fix_normals()
+        return result
+
     def save_mesh(
         self,
         mesh: trimesh.Trimesh,
@@ -200,18 +841,83 @@ class MeshConverter:
         # Ensure correct extension
         output_path = str(Path(output_path).with_suffix(f".{file_format}"))
 
-        mesh.export(output_path)
+        if file_format == "stl":
+            self._write_binary_stl(mesh, output_path)
+        else:
+            mesh.export(output_path)
         print(f"Mesh saved to: {output_path}")
 
         return output_path
 
+    def _write_binary_stl(self, mesh: trimesh.Trimesh, output_path: str):
+        """
+        Write a binary STL file straight from the mesh arrays
+
+        Args:
+            mesh: Input mesh
+            output_path: Output file path
+        """
+        records = np.zeros(len(mesh.faces), dtype=_STL_RECORD)
+        records["normal"] = mesh.face_normals
+        triangles = mesh.vertices[mesh.faces]
+        records["v0"] = triangles[:, 0]
+        records["v1"] = triangles[:, 1]
+        records["v2"] = triangles[:, 2]
+
+        with open(output_path, "wb") as f:
+            f.write(b"\0" * 80)
+            f.write(np.uint32(len(records)).tobytes())
+            f.write(records.tobytes())
+
+    def compile(
+        self,
+        depth: Optional[int] = None,
+        density_threshold: float = 0.01,
+        resolution: int = 20000,
+        **kwargs
+    ) -> Callable[..., str]:
+        """
+        Prepare a converter with fixed parameters for repeated use
+
+        Binds the numeric parameters once and triggers JIT compilation of
+        the Numba normal kernel up front, so the first cloud of a batch
+        does not pay the compile latency.
+
+        Args:
+            depth: Poisson reconstruction depth (None = pick from point count)
+            density_threshold: Quantile of low-density vertices to remove
+            resolution: Voxel resolution for the watertight fallback
+            **kwargs: Other convert_to_watertight_mesh arguments to bind
+
+        Returns:
+            Callable taking ply_path (and optional overrides) that runs
+            convert_to_watertight_mesh
+        """
+        kernel = _numba_normals()
+        if kernel is not None:
+            points = np.zeros((1, 3), dtype=np.float64)
+            kernel(points, np.zeros((1, 1), dtype=np.int64),
+                   np.ones((1, 1), dtype=np.bool_))
+
+        return partial(
+            self.convert_to_watertight_mesh,
+            depth=depth,
+            density_threshold=density_threshold,
+            resolution=resolution,
+            **kwargs
+        )
+
     def convert_to_watertight_mesh(
         self,
         ply_path: str,
         output_dir: str = "data/output",
-        depth: int = 9,
+        depth: Optional[int] = None,
         clean: bool = True,
-        output_format: str = "obj"
+        output_format: str = "obj",
+        camera_location: Optional[np.ndarray] = None,
+        density_threshold: float = 0.01,
+        resolution: int = 20000,
+        use_vdb: bool = False
     ) -> str:
         """
         Complete pipeline: Convert point cloud to watertight mesh
@@ -219,9 +925,14 @@ class MeshConverter:
         Args:
             ply_path: Path to input .ply point cloud file
             output_dir: Output directory
-            depth: Poisson reconstruction depth
+            depth: Poisson reconstruction depth (None = pick from point count)
             clean: Whether to clean the mesh
             output_format: Output file format
+            camera_location: Camera origin used to orient estimated normals
+                             (None = consistent tangent-plane orientation)
+            density_threshold: Quantile of low-density vertices to remove
+            resolution: Voxel resolution for the watertight fallback
+            use_vdb: Use the sparse OpenVDB level set for the fallback
 
         Returns:
             Path to output watertight mesh file
@@ -232,19 +943,44 @@ class MeshConverter:
         # Step 1: Load point cloud
         pcd = self.load_point_cloud(ply_path)
 
+        # One KD-tree serves depth selection and normal estimation
+        avg_spacing = None
+        tree = None
+        if depth is None:
+            from scipy.spatial import cKDTree
+
+            points = np.asarray(pcd.points)
+            tree = cKDTree(points)
+            avg_spacing = _average_spacing(points, self.num_workers, tree)
+            depth = self.select_poisson_depth(pcd, avg_spacing)
+
+        # Drop points finer than the octree can resolve
+        if clean:
+            down = self.downsample_for_poisson(pcd, depth)
+            if down is not pcd:
+                # No longer matches the cloud
+                avg_spacing = None
+                tree = None
+            pcd = down
+
         # Step 2: Estimate normals if not present
         if not pcd.has_normals():
-            pcd = self.estimate_normals(pcd)
+            pcd = self.estimate_normals(
+                pcd,
+                camera_location=camera_location,
+                avg_spacing=avg_spacing,
+                tree=tree
+            )
 
         # Step 3: Poisson reconstruction
         mesh, densities = self.poisson_reconstruction(pcd, depth=depth)
 
         # Step 4: Clean mesh
         if clean:
-            mesh = self.clean_mesh(mesh, densities)
+            mesh = self.clean_mesh(mesh, densities, density_threshold)
 
         # Step 5: Make watertight
-        tri_mesh = self.make_watertight(mesh)
+        tri_mesh = self.make_watertight(mesh, resolution, use_vdb)
 
         # Step 6: Save mesh
         base_name = Path(ply_path).stem
@@ -268,6 +1004,9 @@ class MeshConverter:
         Args:
             mesh_path: Path to mesh file
         """
+        import open3d as o3d
+        import trimesh
+
         mesh = trimesh.load(mesh_path)
 
         # Convert to Open3D for visualization
@@ -277,3 +1016,14 @@ class MeshConverter:
         o3d_mesh.compute_vertex_normals()
 
         o3d.visualization.draw_geometries([o3d_mesh])
+
+
+@lru_cache(maxsize=1)
+def get_mesh_converter() -> MeshConverter:
+    """
+    Get a shared MeshConverter instance
+
+    Returns:
+        Cached MeshConverter instance
+    """
+    return MeshConverter()
@@ -5,6 +5,7 @@ import numpy as np
 from PIL import Image
 import torch
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 import cv2
@@ -195,3 +196,17 @@ class SAMProcessor:
         """Load mask from file path"""
         mask = Image.open(mask_path).convert("L")
         return np.array(mask)
+
+
+@lru_cache(maxsize=1)
+def get_sam_processor(checkpoint_path=None) -> SAMProcessor:
+    """
+    Get a shared SAMProcessor so model weights load once per process
+
+    Args:
+        checkpoint_path: Path to SAM 3D Objects checkpoint
+
+    Returns:
+        Cached SAMProcessor instance
+    """
+    return SAMProcessor(checkpoint_path)
@@ -2,21 +2,34 @@
 """
 Test script to verify that all dependencies are properly installed
 """
+import subprocess
 import sys
-from importlib import import_module
 
 
 def test_import(module_name, package_name=None):
-    """Test if a module can be imported"""
+    """Test if a module can be imported (in a fresh interpreter)"""
     display_name = package_name or module_name
-    try:
-        mod = import_module(module_name)
-        version = getattr(mod, '__version__', 'unknown version')
+    # A separate process keeps a failed or partial import from affecting
+    # later checks, and keeps heavy modules out of this process
+    code = (
+        "from importlib import import_module\n"
+        f"mod = import_module({module_name!r})\n"
+        "print(getattr(mod, '__version__', 'unknown version'))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0:
+        lines = result.stdout.strip().splitlines()
+        version = lines[-1] if lines else "unknown version"
         print(f"✓ {display_name:25s} - {version}")
         return True
-    except ImportError as e:
+    else:
+        error = result.stderr.strip().splitlines()
         print(f"✗ {display_name:25s} - NOT INSTALLED")
-        print(f"  Error: {e}")
+        print(f"  Error: {error[-1] if error else 'unknown error'}")
         return False
 
 